@@ -6,6 +6,18 @@ import pandas as pd
 from . import PriceHistory, PricePoint
 from .. import SourceType
 from .. import sources
+from ..utils.dataframes import copy_cached_dataframe
+from ..utils.disk_cache import disk_cached
+
+
+DOWNCAST_TO_FLOAT32 = False
+"""Set this to `True` to store price histories with float32 rather than float64
+columns, which halves the memory held by the cache. Note that float32 only has about
+7 significant digits, so, e.g., a price of 65432.12 becomes 65432.12109375.
+
+The flag is part of the cache keys (in memory and on disk), so it can be toggled at any
+time without having to clear any caches.
+"""
 
 
 def custom_cache_wrapper(func):
@@ -16,6 +28,26 @@ def custom_cache_wrapper(func):
 
 
 @custom_cache_wrapper
+@disk_cached(ttl_seconds=24 * 60 * 60)
+def _price_history(
+    query: str,
+    source: SourceType,
+    currency_preference: str,
+    downcast_to_float32: bool,
+) -> PriceHistory:
+    """Cached worker for `price_history`. (`downcast_to_float32` is an argument rather
+    than read from `DOWNCAST_TO_FLOAT32` directly so it is part of the cache keys.)
+    """
+    src = sources.get_source(source)
+    src.rate_limiter.rate_limit()
+    df, effective_currency = src.get_price_history_bruteforcefully(
+        query, currency_preference
+    )
+    if downcast_to_float32:
+        df = df.astype({c: "float32" for c in df.select_dtypes("float64").columns})
+    return PriceHistory(df, effective_currency.upper())
+
+
 def price_history(
     query: str,
     source: SourceType = "yahoo",
@@ -32,16 +64,61 @@ def price_history(
       to "USD". The effective currency might differ and will be returned in the second
       return value.
     """
-    src = sources.get_source(source)
-    src.rate_limiter.rate_limit()
-    df, effective_currency = src.get_price_history_bruteforcefully(
-        query, currency_preference
+    df, currency = _price_history(
+        query, source, currency_preference, DOWNCAST_TO_FLOAT32
     )
-    return PriceHistory(df.copy(), effective_currency.upper())
+    return PriceHistory(copy_cached_dataframe(df), currency)
     # (Returning a copy of the dataframe so the cached original is preserved even if it
     # gets modified by the caller.)
 
 
+def _align_to_index(when: pd.Timestamp, index: pd.DatetimeIndex) -> pd.Timestamp:
+    """Localize a naive `when` to the timezone of `index`, just like pandas does when
+    looking up date strings in a tz-aware index.
+    """
+    if when.tz is None and index.tz is not None:
+        return when.tz_localize(index.tz)
+    return when
+
+
+@custom_cache_wrapper
+def _price_point(
+    query: str,
+    when: pd.Timestamp,
+    source: SourceType,
+    currency_preference: str,
+    downcast_to_float32: bool,
+) -> PricePoint:
+    """Cached worker for `price_point`."""
+    # (Using the cached dataframe directly, since it only gets read here.)
+    df, currency = _price_history(
+        query, source, currency_preference, downcast_to_float32
+    )
+    pos = df.index.get_indexer([_align_to_index(when, df.index)], method="nearest")[0]
+    return PricePoint(
+        when=df.index[pos], price=float(df["close"].values[pos]), currency=currency
+    )
+
+
+@custom_cache_wrapper
+def _price_point_strict(
+    query: str,
+    when: pd.Timestamp,
+    source: SourceType,
+    currency_preference: str,
+    downcast_to_float32: bool,
+) -> PricePoint:
+    """Cached worker for `price_point_strict`."""
+    # (Using the cached dataframe directly, since it only gets read here.)
+    df, currency = _price_history(
+        query, source, currency_preference, downcast_to_float32
+    )
+    pos = df.index.get_loc(_align_to_index(when, df.index))
+    return PricePoint(
+        when=df.index[pos], price=float(df["close"].values[pos]), currency=currency
+    )
+
+
 def price_point(
     query: str,
     when: Union[str, pd.Timestamp],
@@ -59,23 +136,45 @@ def price_point(
     price_point("AAPL", "2020-01-01")
     ```
     """
-    df, currency = price_history(query, source, currency_preference)
-    price = df.iloc[df.index.get_indexer([when], method="nearest")[0]]
-    return PricePoint(when=price.name, price=float(price), currency=currency)
+    # (Normalizing `when` before hitting the cache so that, e.g., "2020-01-01" and
+    # `pd.Timestamp("2020-01-01")` share the same cache entry.)
+    return _price_point(
+        query, pd.Timestamp(when), source, currency_preference, DOWNCAST_TO_FLOAT32
+    )
 
 
 def price_point_strict(
     query: str,
-    when: str,
+    when: Union[str, pd.Timestamp],
     source: SourceType = "yahoo",
     currency_preference: str = "USD",
 ) -> PricePoint:
     """Same as `price_point` but will return either the price at the exact point in time
     or raise a KeyError.
     """
-    df, currency = price_history(query, source, currency_preference)
+    try:
+        timestamp = pd.Timestamp(when)
+    except ValueError as exc:  # (Unparseable `when` can't be in the index either.)
+        raise KeyError(when) from exc
+    return _price_point_strict(
+        query, timestamp, source, currency_preference, DOWNCAST_TO_FLOAT32
+    )
+
+
+@custom_cache_wrapper
+def _price_latest(
+    query: str,
+    source: SourceType,
+    currency_preference: str,
+    downcast_to_float32: bool,
+) -> PricePoint:
+    """Cached worker for `price_latest`."""
+    # (Using the cached dataframe directly, since it only gets read here.)
+    df, currency = _price_history(
+        query, source, currency_preference, downcast_to_float32
+    )
     return PricePoint(
-        when=df.loc[when].name, price=float(df.loc[when]["close"]), currency=currency
+        when=df.index[-1], price=float(df["close"].values[-1]), currency=currency
     )
 
 
@@ -85,7 +184,19 @@ def price_latest(
     currency_preference: str = "USD",
 ) -> PricePoint:
     """Same as `price_point` but will return the latest price."""
-    df, currency = price_history(query, source, currency_preference)
-    return PricePoint(
-        when=df.iloc[-1].name, price=float(df.iloc[-1]["close"]), currency=currency
-    )
+    return _price_latest(query, source, currency_preference, DOWNCAST_TO_FLOAT32)
+
+
+def _clear_price_caches() -> None:
+    """Clear the cache of `price_history` along with the caches of the price point
+    functions, which build on it and would otherwise keep serving stale prices.
+    """
+    _price_history.cache_clear()
+    _price_point.cache_clear()
+    _price_point_strict.cache_clear()
+    _price_latest.cache_clear()
+
+
+# Give access to the caches via the public function:
+price_history.cache_clear = _clear_price_caches
+price_history.cache_info = _price_history.cache_info
@@ -3,10 +3,12 @@
 import functools
 from pycoingecko import CoinGeckoAPI
 from ..symbol import Symbol
+from ..utils.disk_cache import disk_cached
 from . import SearchResult
 
 
 @functools.lru_cache(maxsize=None)
+@disk_cached(ttl_seconds=7 * 24 * 60 * 60)
 def get_symbol_map() -> list:
     """Get the symbol map. Separate function to use caching, so the API doesn't get
     hit too often.
@@ -31,10 +33,11 @@ def coingecko_search(query: str) -> SearchResult:
     """Find coingecko ids that match `query` somehow. Returns `SearchResult`."""
     # Note: No rate limiting here because search is simply a lookup in the symbol map,
     # which gets cached in the first retrieval.
+    lowered_query = query.lower()
     matches = [
         entry
         for entry in get_symbol_map()
-        if query.lower() in entry["name"].lower()
-        or query.lower() in entry["symbol"].lower()
+        if lowered_query in entry["name"].lower()
+        or lowered_query in entry["symbol"].lower()
     ]
     return SearchResult(query=query, symbols=_matches_to_symbols(matches))
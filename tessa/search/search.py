@@ -1,5 +1,6 @@
 """Unified search."""
 
+from concurrent.futures import ThreadPoolExecutor
 from . import SearchResult
 from .. import sources
 
@@ -11,9 +12,16 @@ def search(query: str, silent: bool = False) -> SearchResult:
       semantics to the query attribute in the `Symbol` class.)
     - `silent`: No print output if True.
     """
+    all_sources = list(sources.get_all_sources())
+    # Search all sources concurrently: The searches are network-bound and each source
+    # has its own rate limiter, so they don't get in each other's way.
+    with ThreadPoolExecutor(max_workers=len(all_sources)) as executor:
+        results = list(
+            executor.map(lambda source: source.get_search_results(query), all_sources)
+        )
     res = SearchResult(query, [])
-    for source in sources.get_all_sources():
-        res.add_symbols(source.get_search_results(query).symbols)
+    for result in results:
+        res.add_symbols(result.symbols)
     if not silent:
         res.p()
     return res
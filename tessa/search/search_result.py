@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 import functools
-from typing import List, NamedTuple, Callable
+from typing import List, NamedTuple, Callable, Tuple
 import itertools
 import re
 from ..symbol import Symbol
@@ -29,17 +29,25 @@ def matches_word_boundary(query: str, symbol: Symbol) -> int:
     """Try to match a complete word in name, aliases, or query. E.g.:
     `matches_word_boundary("eth", Symbol("ETHW", aliases=["PoW ETH"])) > 0`.
     """
-    query = query.lower()
-    pattern = re.compile(rf"(^|[^a-z0-9]){query}([^a-z0-9]|$)", re.IGNORECASE)
-    if re.search(pattern, symbol.name):
+    pattern = _get_word_boundary_pattern(query.lower())
+    if pattern.search(symbol.name):
         return 1
-    if re.search(pattern, "|".join(symbol.aliases)):
+    if pattern.search("|".join(symbol.aliases)):
         return 2
-    if re.search(pattern, str(symbol.query)):
+    if pattern.search(str(symbol.query)):
         return 3
     return 0
 
 
+@functools.lru_cache(maxsize=128)
+def _get_word_boundary_pattern(query: str) -> re.Pattern:
+    """Build the pattern for `matches_word_boundary`. Cached, since the query stays the
+    same for all the symbols in a search result. (Bounded, since only the most recent
+    queries need to stay cached.)
+    """
+    return re.compile(rf"(^|[^a-z0-9]){query}([^a-z0-9]|$)", re.IGNORECASE)
+
+
 def matches_inanyway(query: str, symbol: Symbol) -> int:
     """Try to match anywhere in name, aliases, or query. E.g.:
     `matches_inanyway("eth", Symbol("TOGETHER")) > 0`.
@@ -70,6 +78,34 @@ BUCKET_SPEC = [
 ]
 
 
+Classification = Tuple[int, int]
+"""The index of the bucket a symbol belongs into and the score it got in that bucket."""
+
+
+def classify(query: str, symbol: Symbol) -> Classification:
+    """Cycle through the predicates in `BUCKET_SPEC` and return the index of the first
+    matching one together with its score. Returns `(len(BUCKET_SPEC), 0)` if nothing
+    matches.
+    """
+    for index, (_, pred) in enumerate(BUCKET_SPEC):
+        score = pred(query, symbol)
+        if score > 0:
+            return index, score
+    return len(BUCKET_SPEC), 0
+
+
+def _bucketize_classified(
+    classified: List[Tuple[Classification, Symbol]]
+) -> List[Bucket]:
+    """Split already classified symbols into buckets, preserving their order."""
+    names = [name for name, _ in BUCKET_SPEC]
+    names.append("Matches not (but was somehow still returned) 🤔")
+    buckets = [Bucket(name, []) for name in names]
+    for (index, _), symbol in classified:
+        buckets[index].symbols.append(symbol)
+    return buckets
+
+
 def bucketize(query: str, symbols: List[Symbol]) -> List[Bucket]:
     """Split a list of `Symbol`s into buckets based on how well a symbol matches the
     `query`.
@@ -77,15 +113,7 @@ def bucketize(query: str, symbols: List[Symbol]) -> List[Bucket]:
     (We're not using `itertools.groupby` here bc we need empty lists for empty buckets,
     which `groupby` doesn't provide.)
     """
-    buckets = []
-    rest = symbols
-    for name, matches_predicate in BUCKET_SPEC:
-        matches_query_predicate = functools.partial(matches_predicate, query)
-        hits = list(filter(matches_query_predicate, rest))
-        rest = list(itertools.filterfalse(matches_query_predicate, rest))
-        buckets.append(Bucket(name, hits))
-    buckets.append(Bucket("Matches not (but was somehow still returned) 🤔", rest))
-    return buckets
+    return _bucketize_classified([(classify(query, s), s) for s in symbols])
 
 
 # ----- Sorting and removing duplicates -----
@@ -95,16 +123,11 @@ def create_sort_key_for_query(query: str) -> Callable:
     """Create a sort key function that classifies a `Symbol` based on `query`."""
 
     def symbol_sort_key(symbol: Symbol) -> int:
-        """Cycle through the predicates in `BUCKET_SPEC` and use an offset to return an
-        int based on the matching quality.
-        """
-        offset = 10
-        for _, pred in BUCKET_SPEC:
-            score = pred(query, symbol)
-            if score > 0:
-                return offset + score
-            offset += 10
-        return 999
+        """Use an offset per bucket to return an int based on the matching quality."""
+        index, score = classify(query, symbol)
+        if index == len(BUCKET_SPEC):
+            return 999
+        return (index + 1) * 10 + score
 
     return symbol_sort_key
 
@@ -117,7 +140,9 @@ def remove_duplicates(symbols: List[Symbol]) -> List[Symbol]:
     Note further that several symbols can have the same name but still be considered
     different if they differ in any of `query` or `source`.
     """
-    equality_key = lambda symbol: str((symbol.source, symbol.query))
+    # (A tuple key rather than serializing the entire tuple into a string; `str` on
+    # the query is a no-op for string queries and keeps other queries sortable.)
+    equality_key = lambda symbol: (symbol.source, str(symbol.query))
     return [k for k, _ in itertools.groupby(sorted(symbols, key=equality_key))]
 
 
@@ -175,9 +200,15 @@ class SearchResult:
     def add_symbols(self, symbols: List[Symbol]) -> SearchResult:
         """Add symbols. Removes duplicates, sorts, and bucketizes after adding."""
         self.symbols.extend(symbols)
-        self.symbols = remove_duplicates(self.symbols)
-        self.symbols.sort(key=create_sort_key_for_query(self.query))
-        self.buckets = bucketize(self.query, self.symbols)
+        # Classify every symbol only once and use the result both for sorting (the
+        # classifications order the same way as `create_sort_key_for_query`) and for
+        # bucketizing:
+        classified = sorted(
+            ((classify(self.query, s), s) for s in remove_duplicates(self.symbols)),
+            key=lambda x: x[0],
+        )
+        self.symbols = [s for _, s in classified]
+        self.buckets = _bucketize_classified(classified)
         return self
 
     def filter(self, **kwargs) -> SearchResult:
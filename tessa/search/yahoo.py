@@ -1,12 +1,15 @@
 """Get Yahoo Finance search results via scraping."""
 
 from typing import List
+import functools
+import io
 import pandas as pd
-from bs4 import BeautifulSoup
 import requests
 from .. import Symbol
 from ..search import SearchResult
 from .. import sources
+from ..utils.dataframes import copy_cached_dataframe
+from ..utils.disk_cache import disk_cached
 
 NUM_PER_PAGE = 1000
 URL_BLUEPRINT = "https://finance.yahoo.com/lookup/all?s={}&t=A&b={}&c=" + str(
@@ -39,14 +42,33 @@ def get_tables(query: str, offset: int) -> List[pd.DataFrame]:
     sources.get_source("yahoo").rate_limiter.rate_limit()
     url = URL_BLUEPRINT.format(query, str(offset))
     page = requests.get(url, headers=create_headers(url))
-    soup = BeautifulSoup(page.content, "lxml")
-    return [pd.read_html(str(table))[0] for table in soup.find_all("table")]
+    # (Raising rather than treating, e.g., a 429 page as "no results", so that failed
+    # fetches never end up in the caches.)
+    page.raise_for_status()
+    # (`read_html` raises if there are no tables at all, which is the regular case
+    # after the last page of results.)
+    if b"<table" not in page.content.lower():
+        return []
+    # (Parsing the page directly rather than parsing it into a soup first and then
+    # serializing and re-parsing each of its tables.)
+    return pd.read_html(io.BytesIO(page.content))
 
 
 def get_search_results(query: str) -> pd.DataFrame:
     """Get all search results as a dataframe. Returns an empty dataframe if there are no
     results.
+
+    Results are cached. The query is normalized (Yahoo's lookup is case-insensitive)
+    before hitting the cache, so that, e.g., "AAPL" and "aapl" share a cache entry.
+    Every call returns a copy, so modifying the result leaves the cache intact.
     """
+    return copy_cached_dataframe(_get_search_results(query.strip().lower()))
+
+
+@functools.lru_cache(maxsize=None)
+@disk_cached(ttl_seconds=7 * 24 * 60 * 60)
+def _get_search_results(query: str) -> pd.DataFrame:
+    """Cached worker for `get_search_results`."""
     offset = 0
     df = pd.DataFrame()
     tables = get_tables(query, offset)
@@ -65,26 +87,32 @@ def get_search_results(query: str) -> pd.DataFrame:
     return df.reset_index(drop=True)
 
 
+def _record_to_symbol(record: dict, aliases: List[str]) -> Symbol:
+    """Convert a single record of a search result dataframe to a `Symbol`."""
+    symbol = Symbol(name=record["Symbol"], source="yahoo", aliases=aliases)
+    # FIXME Not the optimal solution bc adding attributes that are unknown to the
+    # dataclass Symbol. Add type and exchange as optional attributes to Symbol? Or
+    # add a mixin like YahooSymbol or TypedSymbol or so?? Or could/should the
+    # Symbols in general be much more lenient around which attributes they accept in
+    # addition to the mandatory ones?
+    symbol.type = record["Type"]
+    symbol.exchange = record["Exchange"]
+    return symbol
+
+
 def dataframe_to_symbols(df: pd.DataFrame) -> List[Symbol]:
     """Convert a search result dataframe to a list of `Symbol`s."""
-    symbols = []
-    for _, row in df.iterrows():
-        d = row.to_dict()
-        args = {
-            "name": d["Symbol"],
-            "source": "yahoo",
-            "aliases": [d["Name"]],
-        }
-        symbol = Symbol(**args)
-        # FIXME Not the optimal solution bc adding attributes that are unknown to the
-        # dataclass Symbol. Add type and exchange as optional attributes to Symbol? Or
-        # add a mixin like YahooSymbol or TypedSymbol or so?? Or could/should the
-        # Symbols in general be much more lenient around which attributes they accept in
-        # addition to the mandatory ones?
-        symbol.type = d["Type"]
-        symbol.exchange = d["Exchange"]
-        symbols.append(symbol)
-    return symbols
+    if df.empty:
+        return []
+    # Prepare the aliases on the whole column in one go rather than row by row. (This
+    # also drops missing names, which would otherwise end up as NaN aliases.)
+    aliases_per_row = [[n] if n else [] for n in df["Name"].fillna("").tolist()]
+    # Only convert the columns that are actually needed for the records:
+    records = df[["Symbol", "Type", "Exchange"]].to_dict(orient="records")
+    return [
+        _record_to_symbol(record, aliases)
+        for record, aliases in zip(records, aliases_per_row)
+    ]
 
 
 def yahoo_search(query: str) -> SearchResult:
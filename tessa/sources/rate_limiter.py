@@ -6,8 +6,9 @@ time until it allow-lists a blocked IP address again. That is also why we can't
 library such das Tenacity here.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
+import threading
 import time
 import pendulum
 
@@ -31,16 +32,26 @@ class RateLimiter:
     count_limited_calls: int = 0
     """Number of calls that triggered some waiting."""
 
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    """Serializes calls from several threads so they can't slip through together."""
+
     def reset(self):
         """Reset state and stats."""
-        self.last_call = VERY_LONG_AGO
-        self.count_all_calls = self.count_limited_calls = 0
+        with self._lock:
+            self.last_call = VERY_LONG_AGO
+            self.count_all_calls = self.count_limited_calls = 0
 
     def rate_limit(self):
-        """Enforce the minimum wait time as specified in `wait_seconds`."""
-        diff = (pendulum.now() - self.last_call).total_seconds()
-        if diff < self.wait_seconds:
-            time.sleep(self.wait_seconds - diff)
-            self.count_limited_calls += 1
-        self.last_call = pendulum.now()
-        self.count_all_calls += 1
+        """Enforce the minimum wait time as specified in `wait_seconds`. Thread-safe:
+        Concurrent callers take turns, each waiting for the minimum time after the
+        previous one.
+        """
+        with self._lock:
+            diff = (pendulum.now() - self.last_call).total_seconds()
+            if diff < self.wait_seconds:
+                time.sleep(self.wait_seconds - diff)
+                self.count_limited_calls += 1
+            self.last_call = pendulum.now()
+            self.count_all_calls += 1
@@ -0,0 +1 @@
+"""Utilities used across the package."""
@@ -0,0 +1,23 @@
+"""Dataframe helpers."""
+
+import pandas as pd
+
+
+def copy_on_write_enabled() -> bool:
+    """Check whether pandas' copy-on-write mode is active. (It is always active as of
+    pandas 3 and opt-in via the `mode.copy_on_write` option before.)
+    """
+    if int(pd.__version__.split(".", maxsplit=1)[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # (pandas versions that don't know copy-on-write yet)
+        return False
+
+
+def copy_cached_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of a cached dataframe, so the cached original is preserved even if
+    the copy gets modified by the caller. With copy-on-write, a shallow copy suffices:
+    The data only gets copied if and when the caller actually modifies it.
+    """
+    return df.copy(deep=not copy_on_write_enabled())
@@ -0,0 +1,107 @@
+"""Persistent cache -- keeps results that are expensive to retrieve, such as price
+histories and search results, on disk so they survive the end of a Python session.
+
+The cache is disabled by default. Enable it by setting `CACHE_DIR`, e.g.:
+
+```python
+from tessa.utils import disk_cache
+disk_cache.CACHE_DIR = "~/.tessa_cache"
+```
+
+The in-memory caches sit in front of this cache, so a lookup goes memory → disk →
+network. Note that clearing an in-memory cache (e.g., `price_history.cache_clear()`)
+does not touch the disk cache; use `clear` for that.
+
+(Entries are stored as pickles, so only point `CACHE_DIR` to a directory you trust.)
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CACHE_DIR: Optional[str] = None
+"""Directory to store the cached results in. The cache is disabled if this is `None`.
+"""
+
+
+def _get_cache_dir() -> Path:
+    return Path(CACHE_DIR).expanduser()
+
+
+def _get_entry_path(func: Callable, args: tuple, kwargs: dict) -> Path:
+    """Derive the file path of a cache entry from the function and its arguments."""
+    key = repr((func.__module__, func.__qualname__, args, sorted(kwargs.items())))
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return _get_cache_dir() / f"{func.__name__}-{digest}.pickle"
+
+
+def _write_entry(path: Path, res: Any) -> None:
+    """Write a cache entry. Failing to do so only warns, since the result itself has
+    already been retrieved successfully.
+    """
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partially
+        # written entry:
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as stream:
+            tmp_name = stream.name
+            pickle.dump(res, stream)
+        os.replace(tmp_name, path)
+        tmp_name = None
+    except Exception as exc:  # pylint: disable=broad-except
+        warnings.warn(
+            f"Could not write disk cache entry '{path}': {exc}", RuntimeWarning
+        )
+    finally:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+def disk_cached(ttl_seconds: float) -> Callable:
+    """Decorator to cache a function's results on disk for `ttl_seconds`. The
+    arguments are used as the cache key via their `repr`, so they should have a stable
+    one (which is the case for the strings used throughout tessa).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def cached_func(*args, **kwargs):
+            if CACHE_DIR is None:
+                return func(*args, **kwargs)
+
+            path = _get_entry_path(func, args, kwargs)
+            try:
+                if time.time() - path.stat().st_mtime < ttl_seconds:
+                    with open(path, "rb") as stream:
+                        return pickle.load(stream)
+            except Exception:  # pylint: disable=broad-except
+                # Missing, expired, or unreadable entry (e.g., written by a different
+                # version of pandas) -- simply recompute:
+                pass
+
+            res = func(*args, **kwargs)
+            _write_entry(path, res)
+            return res
+
+        return cached_func
+
+    return decorator
+
+
+def clear() -> None:
+    """Remove all entries from the disk cache."""
+    if CACHE_DIR is None:
+        return
+    for path in _get_cache_dir().glob("*.pickle"):
+        path.unlink()
@@ -3,7 +3,7 @@
 Note that tests will hit the network and therefore will take a while to run.
 """
 
-# pylint: disable=missing-docstring
+# pylint: disable=missing-docstring,redefined-outer-name
 
 import pandas as pd
 import pendulum
@@ -11,7 +11,10 @@ import pytest
 from pandas.core.dtypes.dtypes import DatetimeTZDtype
 from tessa import price_history
 from tessa.price import PriceHistory
+from tessa.price import price
 from tessa import sources
+from tessa.sources import Source
+from tessa.sources.rate_limiter import RateLimiter
 
 
 @pytest.mark.net
@@ -66,3 +69,43 @@ def test_error_unsupported_asset_source():
     with pytest.raises(ValueError) as excinfo:
         price_history(query="AAPL", source="xxx")
     assert "Unknown source" in str(excinfo.value)
+
+
+@pytest.fixture()
+def mock_source(mocker) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {"close": [1.0, 2.0]},
+        index=pd.DatetimeIndex(["2018-01-11", "2018-01-12"], tz="utc", name="date"),
+    )
+    mocker.patch(
+        "tessa.sources.get_source",
+        return_value=Source(
+            get_price_history=lambda *_: PriceHistory(df, "usd"),
+            get_search_results=None,
+            rate_limiter=RateLimiter(0),
+        ),
+    )
+    price_history.cache_clear()
+    yield df
+    price_history.cache_clear()
+
+
+def test_modifying_the_returned_dataframe_leaves_the_cache_intact(mock_source):
+    df = mock_source
+    res = price_history("xx")
+    res.df.loc[res.df.index[0], "close"] = 99.0
+    res.df["other"] = 0
+    assert price_history("xx").df.equals(df)
+
+
+def test_downcast_to_float32(mock_source, monkeypatch):
+    monkeypatch.setattr(price, "DOWNCAST_TO_FLOAT32", True)
+    df, _ = price_history("xx")
+    assert df.dtypes.to_string() == "close    float32"
+    assert df.close.tolist() == mock_source.close.tolist()
+    # Toggling the flag takes effect without clearing any caches:
+    monkeypatch.setattr(price, "DOWNCAST_TO_FLOAT32", False)
+    assert price_history("xx").df.dtypes.to_string() == "close    float64"
+    monkeypatch.setattr(price, "DOWNCAST_TO_FLOAT32", True)
+    assert price_history("xx").df.dtypes.to_string() == "close    float32"
+    assert price_history.cache_info().misses == 2
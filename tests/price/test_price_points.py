@@ -2,8 +2,10 @@
 
 import pytest
 import pandas as pd
-from tessa import price_point, price_point_strict, price_latest
+from tessa import price_history, price_point, price_point_strict, price_latest
 from tessa.price import PriceHistory, PricePoint
+from tessa.sources import Source
+from tessa.sources.rate_limiter import RateLimiter
 
 
 # pylint: disable=unused-argument,missing-function-docstring,redefined-outer-name
@@ -21,10 +23,12 @@ def mock_price_history(mocker):
         ],
         "close": [1.0, 2.0, 3.0],
     }
-    mocker.patch(
-        "tessa.price.price.price_history",
+    price_history.cache_clear()
+    yield mocker.patch(
+        "tessa.price.price._price_history",
         return_value=PriceHistory(pd.DataFrame(df_as_json).set_index("date"), "USD"),
     )
+    price_history.cache_clear()
 
 
 def test_price_point_strict(mock_price_history):
@@ -36,6 +40,11 @@ def test_price_point_strict_with_non_existent_timestamp_fails(mock_price_history
         price_point_strict("xx", "2018-01-13")
 
 
+def test_price_point_strict_with_unparseable_timestamp_fails(mock_price_history):
+    with pytest.raises(KeyError):
+        price_point_strict("xx", "not a date")
+
+
 def test_price_point_with_non_existent_timestamp_finds_nearest(mock_price_history):
     assert price_point("xx", "2018-01-13") == PricePoint(
         when=pd.Timestamp("2018-01-12", tz="utc"), price=3.0, currency="USD"
@@ -48,6 +57,39 @@ def test_price_latest(mock_price_history):
     )
 
 
+def test_price_point_cache_is_shared_between_str_and_timestamp(mock_price_history):
+    res = price_point("xx", "2018-01-11")
+    assert price_point("xx", pd.Timestamp("2018-01-11")) == res
+    assert mock_price_history.call_count == 1
+
+
+def test_clearing_price_history_cache_also_clears_price_point_caches(mocker):
+    closes = [1.0]
+
+    def get_price_history(*_) -> PriceHistory:
+        index = pd.DatetimeIndex(["2018-01-11"], tz="utc", name="date")
+        return PriceHistory(pd.DataFrame({"close": closes}, index=index), "USD")
+
+    mocker.patch(
+        "tessa.sources.get_source",
+        return_value=Source(
+            get_price_history=get_price_history,
+            get_search_results=None,
+            rate_limiter=RateLimiter(0),
+        ),
+    )
+    price_history.cache_clear()
+    assert price_latest("xx").price == 1.0
+    assert price_point("xx", "2018-01-11").price == 1.0
+    assert price_point_strict("xx", "2018-01-11").price == 1.0
+    closes[0] = 2.0
+    price_history.cache_clear()
+    assert price_latest("xx").price == 2.0
+    assert price_point("xx", "2018-01-11").price == 2.0
+    assert price_point_strict("xx", "2018-01-11").price == 2.0
+    price_history.cache_clear()
+
+
 def test_verify_pricepoint_types_are_used(mock_price_history):
     assert isinstance(price_point("xx", "2018-01-11"), PricePoint)
     assert isinstance(price_point_strict("xx", "2018-01-11"), PricePoint)
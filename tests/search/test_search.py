@@ -6,6 +6,8 @@ import pytest
 from tessa import search
 from tessa.symbol import Symbol
 from tessa.search import SearchResult
+from tessa.sources import Source
+from tessa.sources.rate_limiter import RateLimiter
 
 
 @pytest.mark.parametrize(
@@ -34,3 +36,21 @@ def test_working_symbols_are_returned_by_search(source: str, symbol: str):
     assert isinstance(res, SearchResult)
     s = [s for s in res.symbols if s.source == source][0]
     assert isinstance(s, Symbol)
+
+
+def test_search_combines_results_from_all_sources(mocker):
+    def create_source(name: str) -> Source:
+        return Source(
+            get_price_history=None,
+            get_search_results=lambda query: SearchResult(
+                query, [Symbol(name, source=name)]  # type: ignore
+            ),
+            rate_limiter=RateLimiter(0),
+        )
+
+    mocker.patch(
+        "tessa.sources.get_all_sources",
+        return_value=iter([create_source("a"), create_source("b")]),
+    )
+    res = search("q", silent=True)
+    assert sorted(s.source for s in res.symbols) == ["a", "b"]
@@ -7,6 +7,8 @@ from tessa.search.search_result import (
     matches_entire_name_or_alias,
     matches_word_boundary,
     matches_inanyway,
+    classify,
+    create_sort_key_for_query,
 )
 from tessa import Symbol
 
@@ -18,6 +20,13 @@ def test_matches_predicates():
     assert matches_inanyway("et h", Symbol("TOGETHER")) == 0
 
 
+def test_classify_and_sort_key_agree():
+    symbols = [Symbol("ETH"), Symbol("ETHW", aliases=["PoW ETH"]), Symbol("X")]
+    assert [classify("eth", s) for s in symbols] == [(0, 1), (1, 2), (3, 0)]
+    sort_key = create_sort_key_for_query("eth")
+    assert [sort_key(s) for s in symbols] == [11, 22, 999]
+
+
 def test_init_with_empty_list():
     res = SearchResult("q", [])
     assert res.query == "q"
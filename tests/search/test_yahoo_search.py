@@ -5,9 +5,14 @@ Note that tests will hit the network and therefore will take a while to run.
 
 # pylint: disable=missing-function-docstring
 
+import pandas as pd
 import pytest
-from tessa.search.yahoo import yahoo_search
+import requests
+from tessa.search import yahoo
+from tessa.search.yahoo import yahoo_search, dataframe_to_symbols
 from tessa.search import SearchResult
+from tessa import sources
+from tessa.utils import disk_cache
 
 
 @pytest.mark.net
@@ -20,3 +25,110 @@ def test_yahoo_search_returns_plausible_results():
 @pytest.mark.net
 def test_yahoo_search_returns_empty_result_for_non_existent_query():
     assert yahoo_search("non_existent_query").symbols == []
+
+
+def test_dataframe_to_symbols():
+    df = pd.DataFrame(
+        {
+            "Symbol": ["TSLA", "TL0.DE"],
+            "Name": ["Tesla, Inc.", None],
+            "Type": ["Stocks", "Stocks"],
+            "Exchange": ["NMS", "GER"],
+        }
+    )
+    symbols = dataframe_to_symbols(df)
+    assert [s.name for s in symbols] == ["TSLA", "TL0.DE"]
+    assert [s.aliases for s in symbols] == [["Tesla, Inc."], []]
+    assert symbols[1].exchange == "GER"
+
+
+def test_dataframe_to_symbols_with_empty_dataframe():
+    assert dataframe_to_symbols(pd.DataFrame()) == []
+
+
+def test_get_search_results_normalizes_query_for_caching(mocker):
+    # pylint: disable=protected-access
+    yahoo._get_search_results.cache_clear()
+    get_tables = mocker.patch("tessa.search.yahoo.get_tables", return_value=[])
+    yahoo.get_search_results("AAPL")
+    yahoo.get_search_results(" aapl")
+    get_tables.assert_called_once_with("aapl", 0)
+    yahoo._get_search_results.cache_clear()
+
+
+def test_modifying_search_results_leaves_the_cache_intact(mocker):
+    # pylint: disable=protected-access
+    yahoo._get_search_results.cache_clear()
+    table = pd.DataFrame({"Symbol": ["TSLA"], "Name": ["Tesla, Inc."]})
+    mocker.patch("tessa.search.yahoo.get_tables", side_effect=[[table], []])
+    res = yahoo.get_search_results("q")
+    res["x"] = 1
+    assert list(yahoo.get_search_results("q").columns) == ["Symbol", "Name"]
+    yahoo._get_search_results.cache_clear()
+
+
+def test_get_tables(mocker):
+    page = mocker.Mock(
+        content=b"<html><body><table><tr><th>Symbol</th><th>Name</th></tr>"
+        b"<tr><td>TSLA</td><td>Tesla, Inc.</td></tr></table></body></html>"
+    )
+    mocker.patch("requests.get", return_value=page)
+    tables = yahoo.get_tables("tesla", 0)
+    assert len(tables) == 1
+    assert tables[0].to_dict(orient="records") == [
+        {"Symbol": "TSLA", "Name": "Tesla, Inc."}
+    ]
+
+
+def test_get_tables_without_tables(mocker):
+    mocker.patch("requests.get", return_value=mocker.Mock(content=b"<html></html>"))
+    assert yahoo.get_tables("nothing", 0) == []
+
+
+TABLE_PAGE = (
+    b"<html><body><table><tr><th>Symbol</th><th>Name</th><th>Type</th>"
+    b"<th>Exchange</th></tr><tr><td>TSLA</td><td>Tesla, Inc.</td><td>Stocks</td>"
+    b"<td>NMS</td></tr></table></body></html>"
+)
+
+
+def create_response(status_code: int, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint: disable=protected-access
+    response.url = "https://finance.yahoo.com/lookup"
+    return response
+
+
+@pytest.fixture()
+def failing_then_working_yahoo(mocker):
+    # pylint: disable=protected-access
+    yahoo._get_search_results.cache_clear()
+    mocker.patch.object(sources.get_source("yahoo").rate_limiter, "rate_limit")
+    mocker.patch(
+        "requests.get",
+        side_effect=[
+            create_response(429, b"<html>Too Many Requests</html>"),
+            create_response(200, TABLE_PAGE),
+            create_response(200, b"<html></html>"),
+        ],
+    )
+    yield
+    yahoo._get_search_results.cache_clear()
+
+
+def test_failed_fetch_is_not_cached(failing_then_working_yahoo):
+    with pytest.raises(requests.HTTPError):
+        yahoo_search("tesla")
+    assert [s.name for s in yahoo_search("tesla").symbols] == ["TSLA"]
+
+
+def test_failed_fetch_is_not_written_to_disk_cache(
+    failing_then_working_yahoo, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    with pytest.raises(requests.HTTPError):
+        yahoo_search("tesla")
+    assert not list(tmp_path.glob("*.pickle"))
+    assert [s.name for s in yahoo_search("tesla").symbols] == ["TSLA"]
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
@@ -2,6 +2,8 @@
 
 # pylint: disable=missing-docstring
 
+import threading
+import time
 import warnings
 import pytest
 import requests
@@ -33,6 +35,19 @@ def test_resetting_rate_limiters():
     assert sources.get_source("yahoo").rate_limiter.count_limited_calls == 0
 
 
+def test_rate_limiter_is_thread_safe():
+    limiter = rate_limiter.RateLimiter(0.05)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.rate_limit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.14
+    assert limiter.count_all_calls == 4
+    assert limiter.count_limited_calls == 3
+
+
 # ----- get_price_history_bruteforcefully tests -----
 
 
@@ -0,0 +1,90 @@
+"""Test the persistent disk cache."""
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+import os
+import time
+import pytest
+from tessa.utils import disk_cache
+
+
+@pytest.fixture()
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def make_counting_func(ttl_seconds: float = 60):
+    calls = []
+
+    @disk_cache.disk_cached(ttl_seconds=ttl_seconds)
+    def func(x, y="y"):
+        calls.append((x, y))
+        return {"x": x, "y": y}
+
+    return func, calls
+
+
+def test_results_are_cached_on_disk(cache_dir):
+    func, calls = make_counting_func()
+    assert func("a") == {"x": "a", "y": "y"}
+    assert func("a") == {"x": "a", "y": "y"}
+    assert func("a", y="z") == {"x": "a", "y": "z"}
+    assert calls == [("a", "y"), ("a", "z")]
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test_expired_entries_get_recomputed(cache_dir):
+    func, calls = make_counting_func(ttl_seconds=60)
+    func("a")
+    for path in cache_dir.glob("*.pickle"):
+        old = time.time() - 120
+        os.utime(path, (old, old))
+    func("a")
+    assert len(calls) == 2
+
+
+def test_unreadable_entries_get_recomputed(cache_dir):
+    func, calls = make_counting_func()
+    func("a")
+    for path in cache_dir.glob("*.pickle"):
+        path.write_bytes(b"not a pickle")
+    assert func("a") == {"x": "a", "y": "y"}
+    assert len(calls) == 2
+
+
+def test_failing_writes_only_warn(cache_dir):
+    @disk_cache.disk_cached(ttl_seconds=60)
+    def func():
+        return lambda: None  # (Can't be pickled)
+
+    with pytest.warns(RuntimeWarning, match="Could not write disk cache entry"):
+        assert callable(func())
+    assert not list(cache_dir.iterdir())
+
+
+def test_unwritable_cache_dir_only_warns(cache_dir, monkeypatch):
+    blocker = cache_dir / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(blocker / "cache"))
+    func, _ = make_counting_func()
+    with pytest.warns(RuntimeWarning, match="Could not write disk cache entry"):
+        assert func("a") == {"x": "a", "y": "y"}
+
+
+def test_clear(cache_dir):
+    func, calls = make_counting_func()
+    func("a")
+    disk_cache.clear()
+    assert not list(cache_dir.glob("*.pickle"))
+    func("a")
+    assert len(calls) == 2
+
+
+def test_cache_is_disabled_by_default(tmp_path):
+    assert disk_cache.CACHE_DIR is None
+    func, calls = make_counting_func()
+    func("a")
+    func("a")
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())